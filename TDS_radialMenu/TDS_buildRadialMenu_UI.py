@@ -482,6 +482,7 @@ class buildRadialMenu_UI(QDialog):
         preset = self._current(data)
         w = self.radial_widget
         w.inner_sections = preset.get("inner_section", OrderedDict())
+        w._rebuild_child_index()
         w.inner_order = list(w.inner_sections.keys())
         w.inner_angles = w.calculate_angles(w.inner_order)
 
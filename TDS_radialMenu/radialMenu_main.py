@@ -5,14 +5,9 @@ from TDS_radialMenu.radialWidget import RightClickHoldDetector, fresh_radial_cls
 
 
 try:
-    _rmb_detector_ref
+    _STATE
 except NameError:
-    _rmb_detector_ref = {"instance": None, "scriptJob": None}
-
-try:
-    radial_enabled
-except NameError:
-    radial_enabled = {"state": True}
+    _STATE = radialWidget._State()
 
 # in radialMenu_main.py (your small wrapper/entry helpers)
 from TDS_radialMenu import radialWidget as rw
@@ -34,32 +29,35 @@ def toggle_smart_preset(force_state=None):
 
 def toggle_radial_menu(force_state=None):
     if force_state is not None:
-        radial_enabled["state"] = bool(force_state)
+        _STATE.enabled = bool(force_state)
     else:
-        radial_enabled["state"] = not radial_enabled["state"]
+        _STATE.enabled = not _STATE.enabled
+    radialWidget._sync_detector_filter(_STATE)
 
-    state = "ON" if radial_enabled["state"] else "OFF"
-    print(f"Radial Menu is now {state}")
+    state = "ON" if _STATE.enabled else "OFF"
+    if radialWidget._DEBUG:
+        print(f"Radial Menu is now {state}")
     cmds.inViewMessage(amg=f"Radial Menu: <hl>{state}</hl>", pos='topCenter', fade=True)
 
 def install_rmb_hold_detector():
     app = QtWidgets.QApplication.instance()
-    if _rmb_detector_ref["instance"]:
-        app.removeEventFilter(_rmb_detector_ref["instance"])
+    if _STATE.detector:
+        _STATE.detector.uninstall()
 
-    detector = RightClickHoldDetector(radial_enabled, parent=app)  # pass toggle dict
-    app.installEventFilter(detector)
-    _rmb_detector_ref["instance"] = detector
+    detector = RightClickHoldDetector(_STATE, parent=app)  # pass toggle state
+    _STATE.detector = detector
+    radialWidget._sync_detector_filter(_STATE)  # only installs while the radial is enabled
 
     # Register cleanup on Maya quit to prevent crash
-    if _rmb_detector_ref["scriptJob"]:
+    if _STATE.script_job:
         try:
-            cmds.scriptJob(kill=_rmb_detector_ref["scriptJob"], force=True)
+            cmds.scriptJob(kill=_STATE.script_job, force=True)
         except:
             pass
-    _rmb_detector_ref["scriptJob"] = cmds.scriptJob(event=["quitApplication", uninstall_radial_menu])
+    _STATE.script_job = cmds.scriptJob(event=["quitApplication", uninstall_radial_menu])
 
-    print("Radial RMB detector installed.")
+    if radialWidget._DEBUG:
+        print("Radial RMB detector installed.")
 
 def select_preset(name: str):
     from TDS_radialMenu import radialWidget as rw
@@ -74,65 +72,67 @@ def launch_or_toggle_radial(force_state=None):
 
     # Helper to apply state change without reinstall
     def _set_state(new_state):
-        radial_enabled["state"] = new_state
+        _STATE.enabled = new_state
+        radialWidget._sync_detector_filter(_STATE)
         state_txt = "ON" if new_state else "OFF"
-        print(f"Radial Menu is now {state_txt}")
+        if radialWidget._DEBUG:
+            print(f"Radial Menu is now {state_txt}")
         cmds.inViewMessage(amg=f"Radial Menu: <hl>{state_txt}</hl>", pos='topCenter', fade=True)
 
-    if _rmb_detector_ref["instance"] is None:
+    if _STATE.detector is None:
         # Not installed
-        detector = RightClickHoldDetector(radial_enabled, parent=app)
-        app.installEventFilter(detector)
-        _rmb_detector_ref["instance"] = detector
+        detector = RightClickHoldDetector(_STATE, parent=app)
+        _STATE.detector = detector
 
         # Register cleanup on Maya quit to prevent crash
-        if _rmb_detector_ref["scriptJob"]:
+        if _STATE.script_job:
             try:
-                cmds.scriptJob(kill=_rmb_detector_ref["scriptJob"], force=True)
+                cmds.scriptJob(kill=_STATE.script_job, force=True)
             except:
                 pass
-        _rmb_detector_ref["scriptJob"] = cmds.scriptJob(event=["quitApplication", uninstall_radial_menu])
+        _STATE.script_job = cmds.scriptJob(event=["quitApplication", uninstall_radial_menu])
 
         if force_state is None:
-            radial_enabled["state"] = True
+            _STATE.enabled = True
         else:
-            radial_enabled["state"] = bool(force_state)
+            _STATE.enabled = bool(force_state)
+        radialWidget._sync_detector_filter(_STATE)
 
-        state_txt = "ON" if radial_enabled["state"] else "OFF"
-        print(f"Radial RMB detector installed and active: {state_txt}")
+        state_txt = "ON" if _STATE.enabled else "OFF"
+        if radialWidget._DEBUG:
+            print(f"Radial RMB detector installed and active: {state_txt}")
         cmds.inViewMessage(amg=f"Radial Menu: <hl>{state_txt}</hl>", pos='topCenter', fade=True)
 
     else:
         # Already installed
         if force_state is None:
             # Toggle
-            _set_state(not radial_enabled["state"])
+            _set_state(not _STATE.enabled)
         else:
             # Force to specific value
             _set_state(bool(force_state))
 
 def uninstall_radial_menu():
     """Completely remove the RMB hold detector and disable the radial menu."""
-    app = QtWidgets.QApplication.instance()
-
-    if _rmb_detector_ref["instance"] is not None:
+    if _STATE.detector is not None:
         try:
             # Call cleanup to prevent crash during shutdown
-            _rmb_detector_ref["instance"].cleanup()
-            app.removeEventFilter(_rmb_detector_ref["instance"])
-            _rmb_detector_ref["instance"] = None
+            _STATE.detector.cleanup()
+            _STATE.detector.uninstall()
+            _STATE.detector = None
         except Exception:
             pass
 
-    if _rmb_detector_ref["scriptJob"]:
+    if _STATE.script_job:
         try:
-            cmds.scriptJob(kill=_rmb_detector_ref["scriptJob"], force=True)
+            cmds.scriptJob(kill=_STATE.script_job, force=True)
         except:
             pass
-        _rmb_detector_ref["scriptJob"] = None
+        _STATE.script_job = None
 
-    radial_enabled["state"] = False
-    print("Radial RMB detector uninstalled.")
+    _STATE.enabled = False
+    if radialWidget._DEBUG:
+        print("Radial RMB detector uninstalled.")
     try:
         cmds.inViewMessage(amg="Radial Menu: <hl>UNINSTALLED</hl>", pos='topCenter', fade=True)
     except:
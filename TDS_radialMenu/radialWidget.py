@@ -4,11 +4,18 @@ from shiboken6 import wrapInstance
 import math
 import maya.cmds as cmds
 import json
+import os
+import weakref
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 menuInfo_filePath = SCRIPT_DIR / "radialMenu_info.json"
+# status prints from the install/toggle helpers; stdout in Maya's script editor can hitch
+_DEBUG = bool(os.environ.get("TDS_RADIAL_DEBUG"))
 from collections import OrderedDict
+from types import MappingProxyType
 
 class _HoleWheelRedirector(QtCore.QObject):
     def __init__(self, owner):
@@ -36,9 +43,25 @@ class _HoleWheelRedirector(QtCore.QObject):
         return False
 
 # ---------- PRESET SUPPORT ----------
+# raw file text keyed by (mtime_ns, size); every caller still gets its own freshly parsed tree
+_DATA_CACHE = {"stamp": None, "text": None}
+
+# active preset picked by the popup's wheel but not written yet (see _commit_active_preset)
+_PENDING_ACTIVE = {"name": None}
+
 def _load_data():
-    with open(menuInfo_filePath, 'r') as f:
-        data = json.load(f, object_pairs_hook=OrderedDict)
+    st = menuInfo_filePath.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _DATA_CACHE["stamp"] != stamp:
+        with open(menuInfo_filePath, 'r') as f:
+            _DATA_CACHE["text"] = f.read()
+        _DATA_CACHE["stamp"] = stamp
+    data = json.loads(_DATA_CACHE["text"], object_pairs_hook=OrderedDict)
+
+    # readers must see a wheel pick that is still waiting to be written
+    pending = _PENDING_ACTIVE["name"]
+    if pending is not None and pending in data.get("presets", {}):
+        data["active_preset"] = pending
 
     # migrate legacy -> presets schema
     if "presets" not in data:
@@ -100,6 +123,7 @@ def _default_colour_from_data(d):
 
 
 def _save_data(data):
+    _DATA_CACHE["stamp"] = None  # don't trust mtime granularity for our own writes
     with open(menuInfo_filePath, 'w') as f:
         json.dump(data, f, indent=4)
 
@@ -116,12 +140,28 @@ def list_presets():
 def set_active_preset(name: str) -> bool:
     d = _load_data()
     if name in d["presets"]:
+        _PENDING_ACTIVE["name"] = None  # an explicit pick supersedes a deferred one
         d["active_preset"] = name
         _save_data(d)
         return True
     cmds.warning(f"[RadialMenu] Preset '{name}' not found.")
     return False
 
+def set_active_preset_inmem(name: str, data) -> bool:
+    """Make name the active preset in data and for later _load_data() calls, without writing
+    the file; _commit_active_preset() persists it."""
+    if name in data["presets"]:
+        data["active_preset"] = name
+        _PENDING_ACTIVE["name"] = name
+        return True
+    cmds.warning(f"[RadialMenu] Preset '{name}' not found.")
+    return False
+
+def _commit_active_preset():
+    name = _PENDING_ACTIVE["name"]
+    if name is not None:
+        set_active_preset(name)
+
 def is_preset_active(name: str) -> bool:
     d = _load_data()
     return bool(d.get("presets", {}).get(name, {}).get("active", True))
@@ -505,6 +545,21 @@ def _unique_label(base: str, existing_keys):
         if cand not in existing_keys:
             return cand
         i += 1
+# hover state of RadialMenu when nothing is highlighted (hole or far outside)
+_HOVER_CLEAR = (None, None, 0)
+
+# shared read-only fallback for hot-path `.get(...)` chains (never mutated)
+_EMPTY = MappingProxyType({})
+
+@lru_cache(maxsize=4096)
+def _angle_cached(dx, dy):
+    """Cursor angle in degrees [0, 360) for an integer pixel offset; the cursor tends to
+    revisit the same offsets, so most hover events skip atan2 entirely."""
+    return math.degrees(math.atan2(dy, dx)) % 360
+
+# child bucket entry for a half-degree that straddles a wedge edge (resolved exactly with bisect)
+_EDGE_BUCKET = object()
+
 def get_main_window():
     ptr = omui.MQtUtil.mainWindow()
     return wrapInstance(int(ptr), QtWidgets.QMainWindow)
@@ -588,6 +643,7 @@ class RadialMenuWidget(QtWidgets.QWidget):
 
         # now load sections
         self.inner_sections = _active_preset(data).get("inner_section", OrderedDict())
+        self._rebuild_child_index()
         self.inner_order = list(self.inner_sections.keys())
         self.inner_angles = self.calculate_angles(self.inner_order)
 
@@ -597,6 +653,8 @@ class RadialMenuWidget(QtWidgets.QWidget):
         self.hovered_children = None
         self.hovered_child_angles = {}
 
+        self._recalc_display_metrics()  # seeds display_* and the squared hover thresholds
+
         self.trigger_signal.connect(self.execute_action)
 
     def _preview_preset(self, preset_name: str):
@@ -605,6 +663,7 @@ class RadialMenuWidget(QtWidgets.QWidget):
         preset_data = data["presets"].get(preset_name, OrderedDict())
 
         self.inner_sections = preset_data.get("inner_section", OrderedDict())
+        self._rebuild_child_index()
         self.inner_order = list(self.inner_sections.keys())
         self.inner_angles = self.calculate_angles(self.inner_order)
 
@@ -652,6 +711,16 @@ class RadialMenuWidget(QtWidgets.QWidget):
                 + getattr(self, "outer_ring_width", 25)
         )
 
+        # Squared hover thresholds for mouseMoveEvent (compared against dx*dx + dy*dy)
+        outer_inner_r = self.display_radius + getattr(self, "ring_gap", 5)
+        hyst = max(12, int(getattr(self, "outer_ring_width", 25) * 0.6))
+        self._hole2 = self.display_hole ** 2
+        self._inner_r2 = self.display_radius ** 2
+        self._outer_inner2 = outer_inner_r ** 2
+        self._outer_outer2 = self.outer_radius ** 2
+        self._ring_inner_hyst2 = max(self.display_hole, outer_inner_r - hyst) ** 2
+        self._ring_outer_hyst2 = (self.outer_radius + hyst) ** 2
+
     def _apply_preset_colours(self, preset):
         colour_data = preset.get("colour", {})
 
@@ -898,6 +967,7 @@ class RadialMenuWidget(QtWidgets.QWidget):
         data = _load_data()
         preset = data["presets"].get(pname, OrderedDict())
         self.inner_sections = preset.get("inner_section", OrderedDict())
+        self._rebuild_child_index()
         self.inner_order = list(self.inner_sections.keys())
         self.inner_angles = self.calculate_angles(self.inner_order)
 
@@ -951,6 +1021,7 @@ class RadialMenuWidget(QtWidgets.QWidget):
         data = _load_data()
         preset = data["presets"].get(pname, OrderedDict())
         self.inner_sections = preset.get("inner_section", OrderedDict())
+        self._rebuild_child_index()
 
         self.active_sector = parent_label
         self.hovered_children = self.inner_sections.get(parent_label, {}).get("children", OrderedDict())
@@ -1010,6 +1081,7 @@ class RadialMenuWidget(QtWidgets.QWidget):
         _save_data(data)
         data = _load_data()
         self.inner_sections = data["presets"][self._preview_name].get("inner_section", OrderedDict())
+        self._rebuild_child_index()
         self.inner_order = list(self.inner_sections.keys())
         self.inner_angles = self.calculate_angles(self.inner_order)
 
@@ -1054,6 +1126,7 @@ class RadialMenuWidget(QtWidgets.QWidget):
             data = _load_data()
             preset = data["presets"].get(pname, OrderedDict())
             self.inner_sections = preset.get("inner_section", OrderedDict())
+            self._rebuild_child_index()
             self.inner_order = list(self.inner_sections.keys())
             self.inner_angles = self.calculate_angles(self.inner_order)
 
@@ -1102,6 +1175,7 @@ class RadialMenuWidget(QtWidgets.QWidget):
             data = _load_data()
             preset = data["presets"].get(pname, OrderedDict())
             self.inner_sections = preset.get("inner_section", OrderedDict())
+            self._rebuild_child_index()
 
             self.active_sector = parent_label
             self.hovered_children = self.inner_sections.get(parent_label, {}).get("children", {})
@@ -1349,6 +1423,7 @@ class RadialMenuWidget(QtWidgets.QWidget):
                 pname = getattr(self, "_preview_name", None) or get_active_preset()
                 preset = data["presets"].get(pname, OrderedDict())
                 self.inner_sections = preset.get("inner_section", OrderedDict())
+                self._rebuild_child_index()
                 self.inner_order = list(self.inner_sections.keys())
                 self.inner_angles = self.calculate_angles(self.inner_order)
 
@@ -1405,6 +1480,7 @@ class RadialMenuWidget(QtWidgets.QWidget):
             pname = getattr(self, "_preview_name", None) or get_active_preset()
             preset = data["presets"].get(pname, OrderedDict())
             self.inner_sections = preset.get("inner_section", OrderedDict())
+            self._rebuild_child_index()
             self.inner_order = list(self.inner_sections.keys())
             self.inner_angles = self.calculate_angles(self.inner_order)
 
@@ -1434,39 +1510,32 @@ class RadialMenuWidget(QtWidgets.QWidget):
         dx = global_pos.x() - global_center.x()
         dy = global_pos.y() - global_center.y()
         angle = (math.degrees(math.atan2(dy, dx)) + 360) % 360
-        distance = math.hypot(dx, dy)
+        dist2 = dx * dx + dy * dy
 
-        # ---- use display_* (scaled) if available, otherwise fall back ----
-        r = getattr(self, "display_radius", self.radius)
-        hole = getattr(self, "display_hole", None)
-        if hole is None:
-            hole = getattr(self, "inner_hole", max(0, int(self.radius * 0.35)))
-
-        inner_radius = r
-        outer_inner_radius = r + self.ring_gap
-        outer_outer_radius = self.outer_radius  # already derived from display_radius in _recalc_display_metrics
-
-        # Hysteresis buffer so children don't flicker at the edges
-        HYST = max(12, int(self.outer_ring_width * 0.6))
-        ring_inner_with_hyst = max(hole, outer_inner_radius - HYST)
-        ring_outer_with_hyst = outer_outer_radius + HYST
+        # ---- squared display_* thresholds (hysteresis included), see _recalc_display_metrics ----
+        hole2 = self._hole2
+        inner_r2 = self._inner_r2
+        outer_inner2 = self._outer_inner2
+        outer_outer2 = self._outer_outer2
 
         sector_at_angle = self.get_sector_from_angle(angle)
+        sections = self.inner_sections
 
         # If we have a sticky parent, keep it active and show its children
         if self._sticky_parent:
             self.active_sector = self._sticky_parent
-            self.hovered_children = self.inner_sections.get(self._sticky_parent, {}).get("children", {})
-            self.hovered_child_angles = self.get_child_angles() if self.hovered_children else {}
+            kids = (sections.get(self._sticky_parent) or _EMPTY).get("children") or _EMPTY
+            self.hovered_children = kids
+            self.hovered_child_angles = self.get_child_angles() if kids else {}
 
-            if self.hovered_children:
-                if outer_inner_radius <= distance <= outer_outer_radius:
+            if kids:
+                if outer_inner2 <= dist2 <= outer_outer2:
                     # inside the child ring: follow hover
                     self.outer_active_sector = self.get_outer_sector_from_angle(angle, self.hovered_child_angles)
                 else:
                     # outside the ring: keep the last explicitly selected child
                     self.outer_active_sector = (
-                        self._sticky_child if self._sticky_child in self.hovered_children else None
+                        self._sticky_child if self._sticky_child in kids else None
                     )
             else:
                 self.outer_active_sector = None
@@ -1475,12 +1544,13 @@ class RadialMenuWidget(QtWidgets.QWidget):
             return
 
         # 2) Inside the inner ring annulus -> highlight inner and (re)load its children
-        if hole <= distance <= inner_radius:
+        if hole2 <= dist2 <= inner_r2:
             self.active_sector = sector_at_angle
             self.outer_active_sector = None
 
-            if self.active_sector and "children" in self.inner_sections.get(self.active_sector, {}):
-                self.hovered_children = self.inner_sections[self.active_sector]["children"]
+            sec = sections.get(sector_at_angle) if sector_at_angle else None
+            if sec is not None and "children" in sec:
+                self.hovered_children = sec["children"]
                 self.hovered_child_angles = self.get_child_angles()
             else:
                 self.hovered_children = None
@@ -1489,11 +1559,11 @@ class RadialMenuWidget(QtWidgets.QWidget):
             return
 
         # 3) In/near the outer ring (with hysteresis)
-        if (ring_inner_with_hyst <= distance <= ring_outer_with_hyst) and self.hovered_children:
+        if (self._ring_inner_hyst2 <= dist2 <= self._ring_outer_hyst2) and self.hovered_children:
             # Keep current inner highlighted while near the ring
             if self.active_sector is None and sector_at_angle:
                 self.active_sector = sector_at_angle
-            if outer_inner_radius <= distance <= outer_outer_radius:
+            if outer_inner2 <= dist2 <= outer_outer2:
                 self.outer_active_sector = self.get_outer_sector_from_angle(angle, self.hovered_child_angles)
             else:
                 self.outer_active_sector = None
@@ -1646,9 +1716,9 @@ class RadialMenuWidget(QtWidgets.QWidget):
             child_key = self.outer_active_sector
 
         if child_key and self.hovered_children:
-            desc = self.hovered_children.get(child_key, {}).get("description", "")
+            desc = (self.hovered_children.get(child_key) or _EMPTY).get("description", "")
         elif self.active_sector:
-            desc = self.inner_sections.get(self.active_sector, {}).get("description", "")
+            desc = (self.inner_sections.get(self.active_sector) or _EMPTY).get("description", "")
 
         if desc:
             font = QtGui.QFont("Arial")
@@ -1847,6 +1917,15 @@ class RadialMenuWidget(QtWidgets.QWidget):
                     return label
         return None
 
+    def _rebuild_child_index(self):
+        """Map every child label to its parent label for the current inner_sections.
+        Labels are only unique per parent; like the old scan, the first parent wins."""
+        index = {}
+        for p, pdata in self.inner_sections.items():
+            for c in (pdata.get("children") or {}):
+                index.setdefault(c, p)
+        self._child_to_parent = index
+
     def _resolve_child(self, child_label):
         """Return (parent_label, child_info) or (None, None). Also refresh hovered_children."""
         # 1) Prefer current active sector if it has this child
@@ -1857,13 +1936,16 @@ class RadialMenuWidget(QtWidgets.QWidget):
                 self.hovered_children = ch
                 return p, ch[child_label]
 
-        # 2) Fallback: search all inner sections
-        for p, pdata in self.inner_sections.items():
-            ch = pdata.get("children", {})
+        # 2) Fallback: reverse index (rebuilt once if inner_sections changed behind our back)
+        for attempt in range(2):
+            p = self._child_to_parent.get(child_label)
+            ch = self.inner_sections.get(p, {}).get("children") if p is not None else None
             if isinstance(ch, dict) and child_label in ch:
                 self.active_sector = p  # keep parent context consistent
                 self.hovered_children = ch  # so subsequent ops see correct dict
                 return p, ch[child_label]
+            if attempt == 0:
+                self._rebuild_child_index()
 
         return None, None
 
@@ -1903,6 +1985,11 @@ class RadialMenuWidget(QtWidgets.QWidget):
 class RadialMenu(QtWidgets.QWidget):
     trigger_signal = QtCore.Signal(str)
 
+    # compiled action scripts, shared by every popup (a new one opens per RMB press);
+    # keyed by the script text, so an edited script just misses
+    _code_cache = {}
+    _CODE_CACHE_MAX = 256
+
     def __init__(self, parent=None):
         super().__init__(parent, QtCore.Qt.Tool)
         self._parent_anchor = None
@@ -1911,6 +1998,20 @@ class RadialMenu(QtWidgets.QWidget):
         self._click_timer.setSingleShot(True)
         self._click_timer.timeout.connect(self._fire_pending_single_click)
 
+        # mouse moves are coalesced: only the latest position is evaluated, once per event-loop turn
+        self._move_timer = QtCore.QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(0)
+        self._move_timer.timeout.connect(self._flush_move)
+        self._move_pending = False
+        self._last_move_global = None
+
+        # wheel preset swaps are written to disk once the wheel has been still for a moment
+        self._preset_commit_timer = QtCore.QTimer(self)
+        self._preset_commit_timer.setSingleShot(True)
+        self._preset_commit_timer.setInterval(200)
+        self._preset_commit_timer.timeout.connect(_commit_active_preset)
+
         self._pending_click_sector = None
         self._pending_click_is_child = False
 
@@ -1938,22 +2039,6 @@ class RadialMenu(QtWidgets.QWidget):
         data = _load_data()
 
         preset = _active_preset(data)
-        colour_data = preset.get("colour", {})  # <- per-preset colours
-
-        # accept either the old or new keys for text colors
-        child_text_fill_hex = colour_data.get("child_text_color", colour_data.get("child_fill_color", "#FFFFFF"))
-        child_text_outline_hex = colour_data.get("child_textOutline_color",
-                                                 colour_data.get("child_outline_color", "#141414DC"))
-
-        self.inner_colour = _q(colour_data.get("inner_colour"), "#454545B4")
-        self.innerHighlight_colour = _q(colour_data.get("innerHighlight_colour"), "#282828B4")
-        self.innerLine_colour = _q(colour_data.get("innerLine_colour"), "#1E1E1E")
-
-        self.child_colour = _q(colour_data.get("child_colour"), "#CE00FF")
-        self.childLine_colour = _q(colour_data.get("childLine_colour"), "#1E1E1E")
-        self.child_fill_color = _q(child_text_fill_hex, "#FFFFFF")
-        self.child_outline_color = _q(child_text_outline_hex, "#141414DC")
-        self.child_outline_thickness = float(colour_data.get("child_outline_thickness", 1.6))
 
         size_data = data.get("ui", {}).get("size", {})
         if not size_data:
@@ -1966,86 +2051,102 @@ class RadialMenu(QtWidgets.QWidget):
         self.inner_hole = int(size_data.get("inner_hole_radius", max(0, int(self.radius * 0.35))))
         self.text_scale = float(size_data.get("text_scale", 2.0))  # increased for 4K monitors
 
-        self.child_font = QtGui.QFont("Arial")
-        self.child_font.setPixelSize(int(11 * self.text_scale))
-        self.child_font.setKerning(True)
-        self.child_font.setHintingPreference(QtGui.QFont.PreferNoHinting)
-        self.child_font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self._apply_preset_colours(preset)  # <- per-preset colours (+ derived pens/brushes); needs outer_radius
+        self._recalc_hit_metrics()
 
-        self.inner_font = QtGui.QFont("Arial")
-        self.inner_font.setPixelSize(int(12 * self.text_scale))  # pick a base you like (11/12/etc.)
-        self.inner_font.setKerning(True)
-        self.inner_font.setHintingPreference(QtGui.QFont.PreferNoHinting)
-        self.inner_font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+        self._rebuild_fonts()
 
-        self.center_pos = QtGui.QCursor.pos()
+        # centre the popup on the cursor in a single geometry change
+        cursor = QtGui.QCursor.pos()
+        self.center_pos = cursor
         extra_height = 80
-        self.move(self.center_pos.x() - self.outer_radius, self.center_pos.y() - self.outer_radius - 20)
-        self.resize(self.outer_radius * 2, self.outer_radius * 2 + extra_height)
-
-        geo = self.frameGeometry()
-        geo.moveCenter(QtGui.QCursor.pos())
-        self.move(geo.topLeft())
+        w = self.outer_radius * 2
+        h = self.outer_radius * 2 + extra_height
+        self.setGeometry(cursor.x() - w // 2, cursor.y() - h // 2, w, h)
+        self._update_global_center()  # refreshed again on show/move/resize
 
         self.inner_sections = _active_preset(data).get("inner_section", OrderedDict())
+        self._preset_name = data.get("active_preset", "")
+        self._caption_pix = None  # (key, QPixmap, y_center) for the hole caption
+        self._inner_path_cache = {}  # label -> QPainterPath of the inner wedge
+        self._outer_path_cache = {}  # label -> QPainterPath of the child wedge
+        self._outer_path_key = None  # child angles dict the outer cache was built for
+        self._child_layer_cache = {}  # parent label -> (children dict, dpr, QPixmap, QPoint)
 
         self.inner_order = list(self.inner_sections.keys())  # ["N", "NE", "E", "SE", "SW", "W", "NW"]
         self.inner_angles = self.calculate_angles(self.inner_order)
+        self._rebuild_soa()
+        self._child_angles_cache = None  # (active_sector, hovered_children, {label: start_angle})
+        self._child_trig = {}  # label -> cos/sin of (start, mid, end) for the cached layout
+        self._child_bucket = [None] * 720
+        self._child_bucket_angles = _EMPTY
 
         self.active_sector = None
         self.outer_active_sector = None
 
         self.hovered_children = None
         self.hovered_child_angles = {}
+        self._last_hover_state = None  # (active, outer_active, zone) of the last repainted move
+        self._update_scheduled = False  # a full-widget repaint is already queued
 
         self.trigger_signal.connect(self.execute_action)
 
         self.show()
+        QtCore.QTimer.singleShot(0, self._focus_bootstrap)
+        self.grabMouse()
+
+    def _focus_bootstrap(self):
+        """Activate, raise and focus the popup in one event-loop hop."""
         self.activateWindow()
         self.raise_()
-        QtCore.QTimer.singleShot(0, self.setFocus)
-        self.grabMouse()
+        self.setFocus()
+
+    @classmethod
+    def _compiled(cls, script, filename):
+        key = (filename, script)
+        code = cls._code_cache.get(key)
+        if code is None:
+            if len(cls._code_cache) >= cls._CODE_CACHE_MAX:
+                cls._code_cache.clear()
+            code = cls._code_cache[key] = compile(script, filename, "exec")
+        return code
 
     def _run_command(self, info):
         script = info.get("command") or ""
         if not script: return
         ns = {"cmds": cmds, "__name__": "__radial__"}
-        exec(compile(script, "<radialMenu:lmb_click>", "exec"), ns, ns)
+        exec(self._compiled(script, "<radialMenu:lmb_click>"), ns, ns)
 
     def _run_release(self, info):
         script = info.get("on_release") or info.get("command") or ""
         if not script: return
         ns = {"cmds": cmds, "__name__": "__radial__"}
-        exec(compile(script, "<radialMenu:rmb_release>", "exec"), ns, ns)
+        exec(self._compiled(script, "<radialMenu:rmb_release>"), ns, ns)
 
     def _run_double(self, info):
         script = info.get("on_double") or ""
         if not script: return
         ns = {"cmds": cmds, "__name__": "__radial__"}
-        exec(compile(script, "<radialMenu:lmb_double>", "exec"), ns, ns)
+        exec(self._compiled(script, "<radialMenu:lmb_double>"), ns, ns)
 
     def _sector_under_pos(self, pos):
         # same math you already use in mouse handlers
         global_pos = pos if isinstance(pos, QtCore.QPoint) else self.mapToGlobal(pos)
-        widget_center = QtCore.QPoint(self.width() // 2, self.height() // 2)
-        global_center = self.mapToGlobal(widget_center)
-        dx = global_pos.x() - global_center.x()
-        dy = global_pos.y() - global_center.y()
-        angle = (math.degrees(math.atan2(dy, dx)) + 360) % 360
-        distance = math.hypot(dx, dy)
-        inner_r = self.radius
-        outer_inner_r = self.radius + self.ring_gap
-        outer_outer_r = self.outer_radius
+        angle, dist2 = self._polar_from_global(global_pos, in_hole=True)
+        if angle is None:
+            return (None, None, None)
 
-        if distance <= inner_r and self.inner_angles:
+        sections = self.inner_sections
+        if dist2 <= self._inner_r2 and self.inner_angles:
             parent = self.get_sector_from_angle(angle)
-            return ("inner", parent, self.inner_sections.get(parent))
-        if outer_inner_r < distance <= outer_outer_r:
+            return ("inner", parent, sections.get(parent))
+        if self._outer_inner2 < dist2 <= self._outer_outer2:
             parent = self.get_sector_from_angle(angle)
             if parent:
-                kids = self.inner_sections.get(parent, {}).get("children", {})
+                kids = (sections.get(parent) or _EMPTY).get("children") or _EMPTY
                 self.hovered_children = kids
                 self.hovered_child_angles = self.get_child_angles() if kids else {}
+                self._last_hover_state = None
                 child = self.get_outer_sector_from_angle(angle, self.hovered_child_angles) if kids else None
                 if child:
                     return ("child", child, kids.get(child))
@@ -2067,6 +2168,9 @@ class RadialMenu(QtWidgets.QWidget):
             QtWidgets.QApplication.instance().removeEventFilter(self._wheel_filter)
         except Exception:
             pass
+        if self._preset_commit_timer.isActive():
+            self._preset_commit_timer.stop()
+            _commit_active_preset()
         super().closeEvent(e)
     def _apply_preset_colours(self, preset):
         colour_data = preset.get("colour", {})
@@ -2086,8 +2190,105 @@ class RadialMenu(QtWidgets.QWidget):
         self.child_outline_color = _q(child_text_outline_hex, "#141414DC")
         self.child_outline_thickness = float(colour_data.get("child_outline_thickness", 1.6))
 
+        # highlighted child = child colour mixed 20% toward white (plus its gradient fade stops)
+        b = self.child_colour
+        lr = int(b.red() + (255 - b.red()) * 0.2)
+        lg = int(b.green() + (255 - b.green()) * 0.2)
+        lb = int(b.blue() + (255 - b.blue()) * 0.2)
+        self._child_colour_light = QtGui.QColor(lr, lg, lb, b.alpha())
+        self._child_colour_light_80 = QtGui.QColor(lr, lg, lb, 80)
+        self._child_colour_light_0 = QtGui.QColor(lr, lg, lb, 0)
+        self._child_colour_80 = QtGui.QColor(b.red(), b.green(), b.blue(), 80)
+        self._child_colour_0 = QtGui.QColor(b.red(), b.green(), b.blue(), 0)
+
+        self._caption_pix = None  # outline/fill colours live in the cached caption
+        self._child_layer_cache = {}  # so do the child wedge colours
+
+        self._inner_line_pen = QtGui.QPen(self.innerLine_colour, 2)
+        self._inner_line_pen.setCosmetic(True)  # hairline
+        self._child_line_pen = QtGui.QPen(self.childLine_colour, 1, QtCore.Qt.SolidLine,
+                                          QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
+        self._child_line_pen.setCosmetic(True)  # keep hairline crisp
+        self._label_white = QtGui.QColor(255, 255, 255)
+        self._desc_colour = QtGui.QColor(220, 220, 220)
+        self._smart_caption_colour = QtGui.QColor(0, 220, 0)
+
+        # text outline: strokePath with this pen matches the old stroker + fillPath
+        self._outline_pen = self._text_outline_pen(self.child_outline_color, self.child_outline_thickness)
+
+        # child wedge brushes, centred at (0,0); paintEvent moves them with setBrushOrigin
+        self._child_gradient_base = self._child_gradient(b, self._child_colour_80, self._child_colour_0)
+        self._child_gradient_hot = self._child_gradient(
+            self._child_colour_light, self._child_colour_light_80, self._child_colour_light_0)
+
+    @staticmethod
+    def _text_outline_pen(colour, thickness):
+        return QtGui.QPen(colour, thickness * 2.0, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
+
+    def _child_gradient(self, solid, fade, clear):
+        gradient = QtGui.QRadialGradient(QtCore.QPointF(0, 0), self.outer_radius)
+        gradient.setColorAt(0.0, solid)
+        gradient.setColorAt(0.4, solid)
+        gradient.setColorAt(0.8, fade)
+        gradient.setColorAt(1.0, clear)
+        return QtGui.QBrush(gradient)
+
+    def _rebuild_fonts(self):
+        """(Re)create the fonts for the current text_scale, with their metrics and text caches."""
+        self.child_font = QtGui.QFont("Arial")
+        self.child_font.setPixelSize(int(11 * self.text_scale))
+        self.child_font.setKerning(True)
+        self.child_font.setHintingPreference(QtGui.QFont.PreferNoHinting)
+        self.child_font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+
+        self.inner_font = QtGui.QFont("Arial")
+        self.inner_font.setPixelSize(int(12 * self.text_scale))  # pick a base you like (11/12/etc.)
+        self.inner_font.setKerning(True)
+        self.inner_font.setHintingPreference(QtGui.QFont.PreferNoHinting)
+        self.inner_font.setStyleStrategy(QtGui.QFont.PreferAntialias)
+
+        self._desc_font = QtGui.QFont("Arial")
+        self._desc_font.setPixelSize(int(10 * self.text_scale))
+
+        self._inner_fm = QtGui.QFontMetricsF(self.inner_font)
+        self._child_fm = QtGui.QFontMetricsF(self.child_font)
+        self._desc_fm = QtGui.QFontMetricsF(self._desc_font)
+        self._caption_fm = {}  # pixel size -> QFontMetrics of the bold caption font
+        self._elide_cache = {}  # (text, int(max_px)) -> elided text; tied to child_font
+        self._label_path_cache = {}  # elided text -> centred QPainterPath in child_font
+        self._inner_static = {}  # inner label -> (QStaticText, advance) in inner_font
+
+    def _recalc_hit_metrics(self):
+        """Squared hover thresholds for _flush_move (compared against dx*dx + dy*dy)."""
+        outer_inner_r = self.radius + self.ring_gap
+        hyst = max(12, int(self.outer_ring_width * 0.6))  # children don't vanish just outside the ring
+        self._hole2 = self.inner_hole ** 2
+        self._inner_r2 = self.radius ** 2
+        self._outer_inner2 = outer_inner_r ** 2
+        self._outer_outer2 = self.outer_radius ** 2
+        self._ring_inner_hyst2 = max(self.inner_hole, outer_inner_r - hyst) ** 2
+        self._ring_outer_hyst2 = (self.outer_radius + hyst) ** 2
+
+    def _update_global_center(self):
+        """Widget center in screen space; hover math reads this instead of calling mapToGlobal."""
+        self._global_center = self.mapToGlobal(QtCore.QPoint(self.width() // 2, self.height() // 2))
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._update_global_center()
+
+    def moveEvent(self, e):
+        super().moveEvent(e)
+        self._update_global_center()
+
     def resizeEvent(self, e):
         super().resizeEvent(e)
+        self._update_global_center()
+        self._recalc_hit_metrics()
+        self._caption_pix = None
+        self._inner_path_cache = {}
+        self._outer_path_cache = {}
+        self._child_layer_cache = {}
         # Full rect = interactive (do NOT carve out the inner hole)
         self.setMask(QtGui.QRegion(self.rect()))
 
@@ -2102,12 +2303,14 @@ class RadialMenu(QtWidgets.QWidget):
             event.ignore()
             return
 
-        names = rw.list_presets()
+        # read the file once; everything below works on this dict
+        data = rw._load_data()
+        names = list(data["presets"].keys())
         if not names or len(names) == 1:
             event.accept()
             return
 
-        cur = rw.get_active_preset()
+        cur = data["active_preset"]
         try:
             idx = names.index(cur)
         except ValueError:
@@ -2120,25 +2323,31 @@ class RadialMenu(QtWidgets.QWidget):
             idx = (idx + step) % len(names)
 
             if rw.is_smart_preset_enabled():
-                ok = rw.set_active_preset(new_name)
+                ok = rw.set_active_preset_inmem(new_name, data)
                 if ok: break
             else:
-                data = rw._load_data()
                 if data["presets"].get(new_name, {}).get("active", True):
-                    ok = rw.set_active_preset(new_name)
+                    ok = rw.set_active_preset_inmem(new_name, data)
                     if ok: break
 
-        # refresh widget from disk
-        data = rw._load_data()
+        # write once the wheel settles (closeEvent flushes it early)
+        self._preset_commit_timer.start()
+
+        # refresh widget (set_active_preset_inmem updated data in place)
         self.inner_sections = rw._active_preset(data).get("inner_section", {})
+        self._preset_name = data.get("active_preset", "")
         self.inner_order = list(self.inner_sections.keys())
         self.inner_angles = self.calculate_angles(self.inner_order)
+        self._rebuild_soa()
+        self._inner_path_cache = {}
+        self._outer_path_cache = {}
+        self._child_angles_cache = None
         self._apply_preset_colours(rw._active_preset(data))
 
         # >>> (2) NEW: immediately recompute hover under current cursor
         self._refresh_hover_from_cursor()
 
-        self.update()
+        self._schedule_update()
         event.accept()
     def calculate_angles(self, order):
         if not order:
@@ -2147,6 +2356,67 @@ class RadialMenu(QtWidgets.QWidget):
         step = 360 / len(order)
         return {label: (start_angle + i * step) % 360 for i, label in enumerate(order)}
 
+    def _rebuild_soa(self):
+        """Flatten inner_sections into parallel per-sector lists (index = position in inner_order)."""
+        labels = list(self.inner_order)
+        self._parent_labels = labels
+        self._parent_children = [self.inner_sections[lab].get("children") or None for lab in labels]
+        self._parent_has_children = [bool(ch) for ch in self._parent_children]
+        self._parent_angles = [self.inner_angles[lab] for lab in labels]
+        self._parent_cos = [math.cos(math.radians(a)) for a in self._parent_angles]
+        self._parent_sin = [math.sin(math.radians(a)) for a in self._parent_angles]
+
+        # half-degree -> sector index table, sampled at each bucket's midpoint;
+        # buckets holding a sector edge are marked -2 and resolved exactly in _sector_index_at
+        n = len(labels)
+        if n:
+            step = 360 / n
+            self._inner_base = 270 - step / 2  # angle where sector 0 starts
+            self._inner_bounds = [i * step for i in range(n)]  # sector starts, unrolled from _inner_base
+            lut = [
+                min(int(((k * 0.5 + 0.25 - self._inner_base) % 360) // step), n - 1) for k in range(720)
+            ]
+            for edge in self._inner_bounds:
+                lut[int(((self._inner_base + edge) % 360) * 2) % 720] = -2
+            self._angle_to_sector_lut = lut
+        else:
+            self._angle_to_sector_lut = []
+
+    def _sector_index_at(self, angle):
+        """Index of the inner sector containing angle (degrees), or -1 when there are none."""
+        lut = self._angle_to_sector_lut
+        if not lut:
+            return -1
+        idx = lut[int(angle * 2) % 720]
+        if idx == -2:
+            bounds = self._inner_bounds
+            idx = min(bisect_right(bounds, (angle - self._inner_base) % 360) - 1, len(bounds) - 1)
+        return idx
+
+    def _rebuild_child_bucket(self, child_angles):
+        """Half-degree -> child label table for child_angles (None = no child there)."""
+        bucket = [None] * 720
+        step = 25 * getattr(self, "child_angle_mult", 1.0)
+        # fill back to front so the first child wins where spans overlap, like the old scan
+        for label, start in reversed(list(child_angles.items())):
+            # buckets whose midpoint (k/2 + 0.25) lies in [start, start + step)
+            k0 = math.ceil(start * 2 - 0.5)
+            k1 = math.ceil((start + step) * 2 - 0.5)
+            for k in range(k0, k1):
+                bucket[k % 720] = label
+
+        # edge buckets are resolved by bisecting the unrolled span starts (first child at 0)
+        labels = list(child_angles.keys())
+        first = child_angles[labels[0]] if labels else 0.0
+        bounds = [i * step for i in range(len(labels) + 1)]
+        for edge in bounds:
+            bucket[int(((first + edge) % 360) * 2) % 720] = _EDGE_BUCKET
+        self._child_bucket = bucket
+        self._child_bucket_angles = child_angles
+        self._child_labels = labels
+        self._child_first = first
+        self._child_bounds = bounds
+
     def focusOutEvent(self, event):
         QtCore.QTimer.singleShot(0, self.close)
 
@@ -2155,6 +2425,7 @@ class RadialMenu(QtWidgets.QWidget):
             self.close()
 
     def mousePressEvent(self, event):
+        self._flush_pending_move()
         b = event.button()
         if b == QtCore.Qt.LeftButton:
             # remember what we’re clicking on; don’t fire yet
@@ -2167,47 +2438,54 @@ class RadialMenu(QtWidgets.QWidget):
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
-        # Get the global mouse position
-        global_pos = event.globalPos() if hasattr(event, 'globalPos') else self.mapToGlobal(event.pos())
-
-        # Map widget center to global space
-        widget_center = QtCore.QPoint(self.width() // 2, self.height() // 2)
-        global_center = self.mapToGlobal(widget_center)
-
-        dx = global_pos.x() - global_center.x()
-        dy = global_pos.y() - global_center.y()
-        angle = math.degrees(math.atan2(dy, dx)) % 360
-        distance = math.hypot(dx, dy)
-
-        inner_radius = self.radius  # outer edge of inner ring (annulus outer radius)
-        inner_hole = self.inner_hole  # hole radius
-        outer_inner_radius = self.radius + self.ring_gap
-        outer_outer_radius = self.outer_radius
-
-        # --- add hysteresis so children don't vanish just outside the ring ---
-        HYST = max(12, int(self.outer_ring_width * 0.6))  # feel free to tune
-        ring_inner_with_hyst = max(inner_hole, outer_inner_radius - HYST)
-        ring_outer_with_hyst = outer_outer_radius + HYST
+        self._last_move_global = event.globalPos() if hasattr(event, 'globalPos') else self.mapToGlobal(event.pos())
+        if not self._move_pending:
+            self._move_pending = True
+            self._move_timer.start()
+
+    def _flush_pending_move(self):
+        """Apply a queued mouse move right away (clicks must see the latest hover state)."""
+        if self._move_pending:
+            self._move_timer.stop()
+            self._flush_move()
+
+    def _flush_move(self):
+        self._move_pending = False
+        global_pos = self._last_move_global
+        if global_pos is None:
+            return
 
-        sector_at_angle = self.get_sector_from_angle(angle)
+        angle, dist2 = self._polar_from_global(global_pos)
 
-        # 1) Inside the hole -> clear everything
-        if distance < inner_hole:
+        # 1) Inside the hole, or beyond even the hysteresis band -> clear everything (no trig needed)
+        if angle is None:
+            if self._last_hover_state == _HOVER_CLEAR:
+                return
+            self._last_hover_state = _HOVER_CLEAR
+            prev = (self.active_sector, self.outer_active_sector, self.hovered_children)
             self.active_sector = None
             self.outer_active_sector = None
             self.hovered_children = None
             self.hovered_child_angles = {}
             self._parent_anchor = None
-            self.update()
+            self._update_hover(*prev)
             return
 
+        idx = self._sector_index_at(angle)
+        sector_at_angle = self._parent_labels[idx] if idx >= 0 else None
+
         # 2) Inside the inner ring annulus -> highlight inner + (re)load its children
-        if inner_hole <= distance <= inner_radius:
+        if dist2 <= self._inner_r2:
+            state = (sector_at_angle, None, 1)
+            if state == self._last_hover_state:
+                return
+            self._last_hover_state = state
+            prev = (self.active_sector, self.outer_active_sector, self.hovered_children)
             self.active_sector = sector_at_angle
             self.outer_active_sector = None
 
-            if self.active_sector and "children" in self.inner_sections.get(self.active_sector, {}):
-                self.hovered_children = self.inner_sections[self.active_sector]["children"]
+            if idx >= 0 and self._parent_has_children[idx]:
+                self.hovered_children = self._parent_children[idx]
                 self.hovered_child_angles = self.get_child_angles()
                 # set/refresh anchor AFTER children exist
                 self._parent_anchor = self.active_sector
@@ -2216,32 +2494,88 @@ class RadialMenu(QtWidgets.QWidget):
                 self.hovered_child_angles = {}
                 self._parent_anchor = None
 
-            self.update()
+            self._update_hover(*prev)
             return
 
         # 3) In/near the outer ring (with hysteresis)
         #    Keep parent anchored; only highlight a child when actually inside the true ring band.
-        if (ring_inner_with_hyst <= distance <= ring_outer_with_hyst) and self.hovered_children and self._parent_anchor:
-            self.active_sector = self._parent_anchor  # don’t let the parent flicker
-            if outer_inner_radius <= distance <= outer_outer_radius:
+        if dist2 >= self._ring_inner_hyst2 and self.hovered_children and self._parent_anchor:
+            if self._outer_inner2 <= dist2 <= self._outer_outer2:
                 # inside the real child ring: resolve child under cursor
-                self.outer_active_sector = self.get_outer_sector_from_angle(angle, self.hovered_child_angles)
+                child = self.get_outer_sector_from_angle(angle, self.hovered_child_angles)
             else:
                 # in the buffer area: keep children visible but no specific child selected
-                self.outer_active_sector = None
+                child = None
 
-            self.update()
+            state = (self._parent_anchor, child, 2)
+            if state == self._last_hover_state:
+                return
+            self._last_hover_state = state
+            prev = (self.active_sector, self.outer_active_sector, self.hovered_children)
+            self.active_sector = self._parent_anchor  # don’t let the parent flicker
+            self.outer_active_sector = child
+
+            self._update_hover(*prev)
             return
 
         # 4) Far outside everything -> clear
+        if self._last_hover_state == _HOVER_CLEAR:
+            return
+        self._last_hover_state = _HOVER_CLEAR
+        prev = (self.active_sector, self.outer_active_sector, self.hovered_children)
         self.active_sector = None
         self.outer_active_sector = None
         self.hovered_children = None
         self.hovered_child_angles = {}
         self._parent_anchor = None
-        self.update()
+        self._update_hover(*prev)
+
+    def _update_hover(self, prev_active, prev_outer, prev_children):
+        """Repaint only what a hover change touched: the old and new wedges, plus the
+        description strip when the hovered sector changed. A different child ring (or
+        none) still repaints everything."""
+        if prev_children is not self.hovered_children:
+            self._schedule_update()
+            return
+        # a region, not a united rect: the bounding box of far-apart pieces is most of the widget
+        region = QtGui.QRegion()
+        for label in (prev_active, self.active_sector):
+            if label:
+                region = region.united(self._sector_bbox(label))
+        for label in (prev_outer, self.outer_active_sector):
+            if label:
+                region = region.united(self._sector_bbox(label, child=True))
+        if prev_active != self.active_sector or prev_outer != self.outer_active_sector:
+            region = region.united(self._description_rect())
+        if not region.isEmpty():
+            self._schedule_update(region)
+
+    def _schedule_update(self, rect=None):
+        """Queue a repaint of rect/region (or the whole widget). Once a full repaint is queued,
+        further requests before the next paintEvent are dropped without touching Qt."""
+        if self._update_scheduled:
+            return
+        if rect is None:
+            self._update_scheduled = True
+            self.update()
+        else:
+            self.update(rect)
+
+    def _sector_bbox(self, label, child=False):
+        """Device rect covered by a painted wedge (including its outline), or the whole
+        widget when the wedge hasn't been painted since the path cache was cleared."""
+        path = (self._outer_path_cache if child else self._inner_path_cache).get(label)
+        if path is None:
+            return self.rect()
+        return path.boundingRect().toAlignedRect().adjusted(-2, -2, 2, 2)
+
+    def _description_rect(self):
+        """Strip below the outer ring where the hover description is drawn."""
+        top = int(self.height() / 2 + self.outer_radius)
+        return QtCore.QRect(0, top, self.width(), max(0, self.height() - top))
 
     def mouseReleaseEvent(self, event):
+        self._flush_pending_move()
         b = event.button()
         if b == QtCore.Qt.LeftButton:
             # start the single-click timer; double-click will cancel it
@@ -2273,6 +2607,7 @@ class RadialMenu(QtWidgets.QWidget):
         event.ignore()
 
     def mouseDoubleClickEvent(self, event):
+        self._flush_pending_move()
         if event.button() != QtCore.Qt.LeftButton:
             event.ignore();
             return
@@ -2289,11 +2624,12 @@ class RadialMenu(QtWidgets.QWidget):
         event.accept()
 
     def paintEvent(self, event):
+        self._update_scheduled = False
 
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
 
-        painter.fillRect(self.rect(), QtCore.Qt.transparent)
+        # no clearing pass: WA_TranslucentBackground already hands us a cleared (exposed) surface
 
         # If you need the -20 shift only for the pop-up, make it conditional.
         y_shift = 0  # 0 for embedded preview
@@ -2308,32 +2644,58 @@ class RadialMenu(QtWidgets.QWidget):
         outer_rect = QtCore.QRectF(center.x() - r, center.y() - r, r * 2, r * 2)
         inner_rect = QtCore.QRectF(center.x() - hole, center.y() - hole, hole * 2, hole * 2)
 
-        for label, angle in self.inner_angles.items():
-            # Build annular wedge path
-            path = QtGui.QPainterPath()
-            path.arcMoveTo(outer_rect, -angle - step / 2.0)
-            path.arcTo(outer_rect, -angle - step / 2.0, step)
-            path.arcTo(inner_rect, -angle + step / 2.0, -step)
-            path.closeSubpath()
-
-            painter.setBrush(self.innerHighlight_colour if label == self.active_sector else self.inner_colour)
-
-            pen = QtGui.QPen(self.innerLine_colour, 2)
-            pen.setCosmetic(True)  # hairline
-            painter.setPen(pen)
-            painter.drawPath(path)
-
-            # Label at mid-radius of the ring
-            mid_r = (hole + r) * 0.5
-            angle_rad = math.radians(angle)
-            label_pos = QtCore.QPointF(center.x() + math.cos(angle_rad) * mid_r,
-                                       center.y() + math.sin(angle_rad) * mid_r)
+        # Wedges are grouped by brush: every plain wedge in one path, the highlighted one alone
+        plain_path = QtGui.QPainterPath()
+        highlight_path = None
+        inner_cache = self._inner_path_cache
+        region = event.region()  # hover changes only ask for the wedges they touched
+        for label, angle in zip(self._parent_labels, self._parent_angles):
+            path = inner_cache.get(label)
+            if path is None:
+                # Build annular wedge path
+                path = QtGui.QPainterPath()
+                path.arcMoveTo(outer_rect, -angle - step / 2.0)
+                path.arcTo(outer_rect, -angle - step / 2.0, step)
+                path.arcTo(inner_rect, -angle + step / 2.0, -step)
+                path.closeSubpath()
+                inner_cache[label] = path
+            if not region.intersects(self._sector_bbox(label)):
+                continue
 
-            text = label
-            painter.setFont(self.inner_font)
-            tw = painter.fontMetrics().horizontalAdvance(text)
-            painter.setPen(QtGui.QColor(255, 255, 255))
-            painter.drawText(label_pos.x() - tw / 2, label_pos.y() + 5, text)
+            if label == self.active_sector:
+                highlight_path = path
+            else:
+                plain_path.addPath(path)
+
+        painter.setPen(self._inner_line_pen)
+        painter.setBrush(self.inner_colour)
+        painter.drawPath(plain_path)
+        if highlight_path is not None:
+            painter.setBrush(self.innerHighlight_colour)
+            painter.drawPath(highlight_path)
+
+        # Labels at mid-radius of the ring (second pass so font/pen are set once)
+        mid_r = (hole + r) * 0.5
+        painter.setFont(self.inner_font)
+        painter.setPen(self._label_white)
+        fm = self._inner_fm
+        cx, cy = center.x(), center.y()
+        ascent, text_h = fm.ascent(), fm.height()
+        statics = self._inner_static
+        for label, c, s in zip(self._parent_labels, self._parent_cos, self._parent_sin):
+            entry = statics.get(label)
+            if entry is None:
+                # glyph layout is done once per label; drawStaticText reuses it every frame
+                st = QtGui.QStaticText(label)
+                st.setTextFormat(QtCore.Qt.PlainText)
+                st.prepare(QtGui.QTransform(), self.inner_font)
+                entry = statics[label] = (st, fm.horizontalAdvance(label))
+            st, tw = entry
+            x = cx + c * mid_r - tw / 2
+            y = cy + s * mid_r + 5  # baseline, as drawText used it
+            if not region.intersects(QtCore.QRectF(x, y - ascent, tw, text_h).toAlignedRect()):
+                continue
+            painter.drawStaticText(QtCore.QPointF(x, y - ascent), st)
 
         if self.hovered_children:
             outer_r = self.outer_radius  # already based on display_radius
@@ -2345,100 +2707,95 @@ class RadialMenu(QtWidgets.QWidget):
             outer_rect = QtCore.QRectF(center.x() - outer_r, center.y() - outer_r, outer_r * 2, outer_r * 2)
             inner_rect = QtCore.QRectF(center.x() - inner_r, center.y() - inner_r, inner_r * 2, inner_r * 2)
 
-            labels = list(child_angles.keys())
-            n = len(labels)
-            total_arc = step * n
-            full_wrap = abs((total_arc % 360.0)) < 1e-3  # true if children span a full ring
-
-            for i, (label, angle) in enumerate(child_angles.items()):
-                path = QtGui.QPainterPath()
-                path.arcMoveTo(outer_rect, -angle)
-                path.arcTo(outer_rect, -angle, -step)
-                path.arcTo(inner_rect, -angle - step, step)
-                path.closeSubpath()
-
-                # gradient FIRST
-                gradient = QtGui.QRadialGradient(center, outer_r)
-                if label == self.outer_active_sector:
-                    base = self.child_colour
-                    white = QtGui.QColor(255, 255, 255, base.alpha())
-                    light = QtGui.QColor(
-                        base.red() + (white.red() - base.red()) * 0.2,
-                        base.green() + (white.green() - base.green()) * 0.2,
-                        base.blue() + (white.blue() - base.blue()) * 0.2,
-                        base.alpha()
-                    )
-                    gradient.setColorAt(0.0, light)
-                    gradient.setColorAt(0.4, light)
-                    gradient.setColorAt(0.8, QtGui.QColor(light.red(), light.green(), light.blue(), 80))
-                    gradient.setColorAt(1.0, QtGui.QColor(light.red(), light.green(), light.blue(), 0))
-                else:
-                    base = self.child_colour
-                    gradient.setColorAt(0.0, base)
-                    gradient.setColorAt(0.4, base)
-                    gradient.setColorAt(0.8, QtGui.QColor(base.red(), base.green(), base.blue(), 80))
-                    gradient.setColorAt(1.0, QtGui.QColor(base.red(), base.green(), base.blue(), 0))
-
-                painter.setBrush(gradient)
+            # child wedge paths stay valid while the (memoised) angle layout is the same
+            if child_angles is not self._outer_path_key:
+                self._outer_path_cache = {}
+                self._outer_path_key = child_angles
+            outer_cache = self._outer_path_cache
+
+            for label, angle in child_angles.items():
+                if label not in outer_cache:
+                    path = QtGui.QPainterPath()
+                    path.arcMoveTo(outer_rect, -angle)
+                    path.arcTo(outer_rect, -angle, -step)
+                    path.arcTo(inner_rect, -angle - step, step)
+                    path.closeSubpath()
+                    outer_cache[label] = path
+
+            # The un-hovered ring (wedges, separators, labels) is rendered once per parent into a
+            # pixmap; plain hover changes only blit it and redraw the highlighted wedge on top
+            dpr = self.devicePixelRatioF()
+            layer = self._child_layer_cache.get(self.active_sector)
+            if layer is None or layer[0] is not self.hovered_children or layer[1] != dpr:
+                pix, origin = self._render_child_layer(child_angles, step, inner_rect, inner_r, outer_r, dpr)
+                layer = self._child_layer_cache[self.active_sector] = (self.hovered_children, dpr, pix, origin)
+            painter.drawPixmap(layer[3], layer[2])
+
+            hot = self.outer_active_sector
+            hot_path = outer_cache.get(hot) if hot is not None else None
+            if hot_path is not None and region.intersects(self._sector_bbox(hot, child=True)):
+                # Source swaps the base wedge's pixels for the hot gradient (AA edges blend by coverage)
+                painter.setBrushOrigin(center)  # gradients are built around (0,0)
+                painter.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
                 painter.setPen(QtCore.Qt.NoPen)
-                painter.drawPath(path)
-
-                pen = QtGui.QPen(self.childLine_colour, 1, QtCore.Qt.SolidLine,
-                                 QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-                pen.setCosmetic(True)  # keep hairline crisp
-                painter.setPen(pen)
-
-                # inner arc (unchanged)
+                painter.setBrush(self._child_gradient_hot)
+                painter.drawPath(hot_path)
+                painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
+
+                # that also wiped the wedge's own arc/edges, so put them back
+                angle = child_angles[hot]
+                c0, s0, cm, sm, c1, s1 = self._child_trig[hot]
+                painter.setPen(self._child_line_pen)
                 painter.drawArc(inner_rect, int(-(angle + step) * 16), int(step * 16))
-
-                # radial separators: draw each boundary once
-                def pt_on_circle(r, deg):
-                    rad = math.radians(deg)
-                    return QtCore.QPointF(center.x() + r * math.cos(rad),
-                                          center.y() + r * math.sin(rad))
-
-                a0 = angle
-                a1 = (angle + step) % 360
-
-                # draw the very first leading edge only if not a full 360° wrap.
-                if i == 0 and not full_wrap:
-                    painter.drawLine(pt_on_circle(inner_r, a0), pt_on_circle(outer_r, a0))
-
-                # always draw the trailing edge
-                painter.drawLine(pt_on_circle(inner_r, a1), pt_on_circle(outer_r, a1))
-
-                angle_deg = (angle + step / 2) % 360
-                angle_rad = math.radians(angle_deg)
+                painter.drawLine(QtCore.QPointF(cx + inner_r * c0, cy + inner_r * s0),
+                                 QtCore.QPointF(cx + outer_r * c0, cy + outer_r * s0))
+                painter.drawLine(QtCore.QPointF(cx + inner_r * c1, cy + inner_r * s1),
+                                 QtCore.QPointF(cx + outer_r * c1, cy + outer_r * s1))
+
+                # ...and any label ink inside it: its own label plus the neighbours' overflow
+                # (the layer is padded for exactly that). Clipped to the wedge so the ink that
+                # survived outside it isn't drawn twice.
+                keys = list(child_angles)
+                i = keys.index(hot)
                 label_radius = (inner_r + outer_r) / 2
-                label_x = center.x() + label_radius * math.cos(angle_rad)
-                label_y = center.y() + label_radius * math.sin(angle_rad)
-                self._draw_child_label(painter, label_x, label_y, label_radius, angle_deg, label, sweep_deg=step)
-
-        name = get_active_preset()
-        if name:
+                painter.save()
+                painter.setClipPath(hot_path, QtCore.Qt.IntersectClip)
+                for label in dict.fromkeys((keys[i - 1], hot, keys[(i + 1) % len(keys)])):
+                    cm, sm = self._child_trig[label][2:4]
+                    self._draw_child_label(painter, cx + label_radius * cm, cy + label_radius * sm, label_radius,
+                                           (child_angles[label] + step / 2) % 360, label, sweep_deg=step)
+                painter.restore()
+
+        name = self._preset_name
+        if name and region.intersects(QtCore.QRectF(cx - hole, cy - hole, hole * 2, hole * 2).toAlignedRect()):
             self._draw_hole_top_caption(painter, center, self.inner_hole, name)
 
+        # the description strip is only repainted when the dirty region reaches it
+        if not region.intersects(self._description_rect()):
+            return
+
         desc = ""
-        if self.outer_active_sector:
+        sections = self.inner_sections
+        outer_key = self.outer_active_sector
+        if outer_key:
             # Prefer the current hovered_children dict
-            if self.hovered_children and self.outer_active_sector in self.hovered_children:
-                desc = self.hovered_children[self.outer_active_sector].get("description", "")
+            kids = self.hovered_children
+            if kids and outer_key in kids:
+                desc = kids[outer_key].get("description", "")
             else:
                 # Fallback: search all children
-                for p, pdata in self.inner_sections.items():
-                    ch = pdata.get("children", {})
-                    if self.outer_active_sector in ch:
-                        desc = ch[self.outer_active_sector].get("description", "")
+                for pdata in sections.values():
+                    ch = pdata.get("children") or _EMPTY
+                    if outer_key in ch:
+                        desc = ch[outer_key].get("description", "")
                         break
         elif self.active_sector:
-            desc = self.inner_sections.get(self.active_sector, {}).get("description", "")
+            desc = (sections.get(self.active_sector) or _EMPTY).get("description", "")
 
         if desc:
-            font = QtGui.QFont("Arial")
-            font.setPixelSize(int(10 * self.text_scale))
-            painter.setFont(font)
-            painter.setPen(QtGui.QColor(220, 220, 220))
-            fm = painter.fontMetrics()
+            painter.setFont(self._desc_font)
+            painter.setPen(self._desc_colour)
+            fm = self._desc_fm
             text_width = fm.horizontalAdvance(desc)
             text_height = fm.height()
 
@@ -2450,15 +2807,92 @@ class RadialMenu(QtWidgets.QWidget):
 
             painter.drawText(center.x() - text_width / 2, y, desc)
 
+    def _render_child_layer(self, child_angles, step, inner_rect, inner_r, outer_r, dpr):
+        """Render every child wedge un-highlighted into a pixmap cropped to the children.
+        Returns (QPixmap, QPoint) - the pixmap and where its top-left goes in the widget."""
+        label_pad = self.child_font.pixelSize()  # labels may poke out of their wedge a little
+        bounds = QtCore.QRect()
+        for label in child_angles:
+            bounds = bounds.united(self._sector_bbox(label, child=True))
+        bounds = bounds.adjusted(-label_pad, -label_pad, label_pad, label_pad).intersected(self.rect())
+
+        pix = QtGui.QPixmap(max(1, int(math.ceil(bounds.width() * dpr))), max(1, int(math.ceil(bounds.height() * dpr))))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(QtCore.Qt.transparent)
+
+        p = QtGui.QPainter(pix)
+        p.setRenderHint(QtGui.QPainter.Antialiasing)
+        p.translate(-bounds.x(), -bounds.y())  # draw in widget coordinates
+        cx, cy = self.width() / 2, self.height() / 2
+
+        # one batched fill; winding keeps overlapping children (more than a full ring) solid
+        outer_cache = self._outer_path_cache
+        base_path = QtGui.QPainterPath()
+        base_path.setFillRule(QtCore.Qt.WindingFill)
+        for label in child_angles:
+            base_path.addPath(outer_cache[label])
+        p.setBrushOrigin(QtCore.QPointF(cx, cy))  # gradients are built around (0,0)
+        p.setPen(QtCore.Qt.NoPen)
+        p.setBrush(self._child_gradient_base)
+        p.drawPath(base_path)
+
+        full_wrap = abs(((step * len(child_angles)) % 360.0)) < 1e-3  # true if children span a full ring
+        trig = self._child_trig  # built together with child_angles
+
+        def pt_on_circle(r, c, s):
+            return QtCore.QPointF(cx + r * c, cy + r * s)
+
+        p.setPen(self._child_line_pen)
+        for i, (label, angle) in enumerate(child_angles.items()):
+            # inner arc (unchanged)
+            p.drawArc(inner_rect, int(-(angle + step) * 16), int(step * 16))
+
+            # radial separators: draw each boundary once
+            c0, s0, cm, sm, c1, s1 = trig[label]
+
+            # draw the very first leading edge only if not a full 360° wrap.
+            if i == 0 and not full_wrap:
+                p.drawLine(pt_on_circle(inner_r, c0, s0), pt_on_circle(outer_r, c0, s0))
+
+            # always draw the trailing edge
+            p.drawLine(pt_on_circle(inner_r, c1, s1), pt_on_circle(outer_r, c1, s1))
+
+        # Labels last, so text never interleaves with brush/pen changes
+        label_radius = (inner_r + outer_r) / 2
+        for label, angle in child_angles.items():
+            cm, sm = trig[label][2:4]
+            angle_deg = (angle + step / 2) % 360
+            self._draw_child_label(p, cx + label_radius * cm, cy + label_radius * sm, label_radius,
+                                   angle_deg, label, sweep_deg=step)
+        p.end()
+        return pix, bounds.topLeft()
+
     def _draw_hole_top_caption(self, painter, center, hole_radius, text):
-        from TDS_radialMenu import radialWidget as rw
-        """Draw text inside the hole, hugged to the top arc, scaled to fit the chord there."""
+        """Draw text inside the hole, hugged to the top arc, scaled to fit the chord there.
+        The outlined text is rendered once into a QPixmap and blitted on later paints."""
         if not text or hole_radius <= 0:
             return
 
-        import math
-        painter.save()
-
+        from TDS_radialMenu import radialWidget as rw
+        if rw.is_smart_preset_enabled():
+            fc = self._smart_caption_colour  # nice bright green
+        else:
+            fc = self.child_fill_color
+
+        dpr = self.devicePixelRatioF()
+        key = (text, int(hole_radius), int(getattr(self, "text_scale", 1.0) * 1000), fc.rgba(), dpr)
+        if self._caption_pix is None or self._caption_pix[0] != key:
+            pix, y_center = self._render_hole_caption(hole_radius, text, fc, dpr)
+            self._caption_pix = (key, pix, y_center)
+        _, pix, y_center = self._caption_pix
+
+        w = pix.width() / dpr
+        h = pix.height() / dpr
+        painter.drawPixmap(QtCore.QPoint(int(round(center.x() - w / 2)),
+                                         int(round(center.y() + y_center - h / 2))), pix)
+
+    def _render_hole_caption(self, hole_radius, text, fc, dpr):
+        """Return (QPixmap, y_center) for the hole caption; y_center is relative to the widget center."""
         pad = max(4, int(hole_radius * 0.3))  # distance from the top arc
         font = QtGui.QFont("Arial")
         font.setBold(True)
@@ -2466,8 +2900,11 @@ class RadialMenu(QtWidgets.QWidget):
         # Start reasonably big; shrink until it fits the chord at that height
         px = max(9, int(hole_radius * 0.30))
         while True:
-            font.setPixelSize(int(px * getattr(self, "text_scale", 1.0)))
-            fm = QtGui.QFontMetrics(font)
+            size = int(px * getattr(self, "text_scale", 1.0))
+            font.setPixelSize(size)
+            fm = self._caption_fm.get(size)
+            if fm is None:
+                fm = self._caption_fm[size] = QtGui.QFontMetrics(font)
             h = fm.height()
 
             # Center line of text placed at y_center from widget center (negative = up)
@@ -2483,31 +2920,30 @@ class RadialMenu(QtWidgets.QWidget):
                 break
             px -= 1
 
-        # Build a centered path so we can outline + fill cleanly
+        # Use same styling as child labels (self._outline_pen carries the outline colour)
+        t = float(getattr(self, "child_outline_thickness", 1.6))
+
+        # Build the path with its bounding box (plus outline margin) at the pixmap origin
+        margin = int(math.ceil(max(0.0, t))) + 2
         path = QtGui.QPainterPath()
         path.addText(0, 0, font, text)
         br = path.boundingRect()
-        # Place the rect center at (center.x, center.y + y_center)
-        path.translate(center.x() - br.center().x(),
-                       center.y() + y_center - br.center().y())
+        path.translate(margin - br.left(), margin - br.top())
+        w = int(math.ceil(br.width())) + 2 * margin
+        h = int(math.ceil(br.height())) + 2 * margin
 
-        # Use same styling as child labels
-        t = float(getattr(self, "child_outline_thickness", 1.6))
-        oc = getattr(self, "child_outline_color", QtGui.QColor(20, 20, 20, 220))
-        if rw.is_smart_preset_enabled():
-            fc = QtGui.QColor(0, 220, 0)  # nice bright green
-        else:
-            fc = getattr(self, "child_fill_color", QtGui.QColor(255, 255, 255))
+        pix = QtGui.QPixmap(int(math.ceil(w * dpr)), int(math.ceil(h * dpr)))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(QtCore.Qt.transparent)
 
+        p = QtGui.QPainter(pix)
+        p.setRenderHint(QtGui.QPainter.Antialiasing)
         if t > 0.0:
-            stroker = QtGui.QPainterPathStroker()
-            stroker.setWidth(t * 2.0)
-            stroker.setJoinStyle(QtCore.Qt.RoundJoin)
-            stroker.setCapStyle(QtCore.Qt.RoundCap)
-            painter.fillPath(stroker.createStroke(path), oc)
+            p.strokePath(path, self._outline_pen)
 
-        painter.fillPath(path, fc)
-        painter.restore()
+        p.fillPath(path, fc)
+        p.end()
+        return pix, y_center
 
     def _draw_child_label(
             self, painter, cx, cy, label_radius, angle_deg, text, sweep_deg,
@@ -2536,20 +2972,30 @@ class RadialMenu(QtWidgets.QWidget):
         painter.setFont(font)
         painter.setRenderHints(QtGui.QPainter.Antialiasing | QtGui.QPainter.TextAntialiasing, True)
 
-        fm = QtGui.QFontMetricsF(font)
+        fm = self._child_fm if font is self.child_font else QtGui.QFontMetricsF(font)
 
-        # fit to arc
+        # fit to arc (elided strings are cached per pixel width; only for the default font)
         arc_rad = math.radians(max(0.0, sweep_deg - 2.0))
         max_px = label_radius * arc_rad
-        s = text
-        if fm.horizontalAdvance(s) > max_px:
-            s = fm.elidedText(s, QtCore.Qt.ElideRight, int(max_px))
-
-        # build path at (0,0), then center it around origin (no baseline bias)
-        path = QtGui.QPainterPath()
-        path.addText(0, 0, font, s)
-        br = path.boundingRect()
-        path.translate(-br.center().x(), -br.center().y())
+        key = (text, int(max_px))
+        s = self._elide_cache.get(key) if font is self.child_font else None
+        if s is None:
+            s = text
+            if fm.horizontalAdvance(s) > max_px:
+                s = fm.elidedText(s, QtCore.Qt.ElideRight, int(max_px))
+            if font is self.child_font:
+                self._elide_cache[key] = s
+
+        # build path at (0,0), then center it around origin (no baseline bias);
+        # the glyph outlines are cached per elided string for the default font
+        path = self._label_path_cache.get(s) if font is self.child_font else None
+        if path is None:
+            path = QtGui.QPainterPath()
+            path.addText(0, 0, font, s)
+            br = path.boundingRect()
+            path.translate(-br.center().x(), -br.center().y())
+            if font is self.child_font:
+                self._label_path_cache[s] = path
 
         # consistent radial inset toward center
         inset = (fm.ascent() + fm.descent()) * -0.10
@@ -2557,40 +3003,44 @@ class RadialMenu(QtWidgets.QWidget):
 
         # outline
         if t and t > 0.0:
-            stroker = QtGui.QPainterPathStroker()
-            stroker.setWidth(t * 2.0)
-            stroker.setJoinStyle(QtCore.Qt.RoundJoin)
-            stroker.setCapStyle(QtCore.Qt.RoundCap)
-            painter.fillPath(stroker.createStroke(path), outline_color)
+            if t == self.child_outline_thickness and outline_color == self.child_outline_color:
+                pen = self._outline_pen
+            else:
+                pen = self._text_outline_pen(outline_color, t)
+            painter.strokePath(path, pen)
 
         # fill
         painter.fillPath(path, fill_color)
         painter.restore()
 
     def get_cursor_angle(self, global_pos):
-        dx = global_pos.x() - self.center_pos.x()
-        dy = global_pos.y() - self.center_pos.y()
-        angle = math.degrees(math.atan2(dy, dx))
-        return (angle + 360) % 360
+        gc = self._global_center
+        return _angle_cached(global_pos.x() - gc.x(), global_pos.y() - gc.y())
+
+    def _polar_from_global(self, pt, in_hole=False):
+        """(angle, dist_sq) of global point pt around the popup center, for comparing against
+        the cached squared thresholds. angle is None where no caller needs one: beyond the
+        hysteresis band, and inside the hole unless in_hole is set."""
+        gc = self._global_center
+        dx = pt.x() - gc.x()
+        dy = pt.y() - gc.y()
+        dist2 = dx * dx + dy * dy
+        if dist2 > self._ring_outer_hyst2 or (dist2 < self._hole2 and not in_hole):
+            return None, dist2
+        return _angle_cached(dx, dy), dist2
 
     def get_sector_from_angle(self, angle):
-        if not self.inner_angles:
-            return None
-        step = 360 / len(self.inner_angles)
-        for key, a in self.inner_angles.items():
-            min_a = (a - step / 2) % 360
-            max_a = (a + step / 2) % 360
-            if min_a < max_a:
-                if min_a <= angle < max_a:
-                    return key
-            else:
-                if angle >= min_a or angle < max_a:
-                    return key
-        return None
+        idx = self._sector_index_at(angle)
+        return self._parent_labels[idx] if idx >= 0 else None
 
     def get_child_angles(self):
         if not self.active_sector or not self.hovered_children:
-            return {}
+            return _EMPTY
+
+        # memoised per (parent, children dict); callers share the returned dict read-only
+        cache = self._child_angles_cache
+        if cache is not None and cache[0] == self.active_sector and cache[1] is self.hovered_children:
+            return cache[2]
 
         labels = list(self.hovered_children.keys())
         num = len(labels)
@@ -2602,28 +3052,31 @@ class RadialMenu(QtWidgets.QWidget):
         # FIX: Start to the left of center_angle
         start_angle = (center_angle - total_arc / 2) % 360
 
-        return {
+        angles = {
             label: (start_angle + i * step) % 360
             for i, label in enumerate(labels)
         }
+        self._child_angles_cache = (self.active_sector, self.hovered_children, angles)
 
-    def get_outer_sector_from_angle(self, angle, _unused=None):
-        base_step = 25
-        step = base_step * getattr(self, "child_angle_mult", 1.0)  # <- use multiplier
-        child_angles = self.get_child_angles()  # already respects multiplier
+        # unit vectors for each child's leading edge, mid line and trailing edge (for paintEvent)
+        trig = {}
+        for label, a0 in angles.items():
+            r0, rm, r1 = math.radians(a0), math.radians(a0 + step / 2), math.radians(a0 + step)
+            trig[label] = (math.cos(r0), math.sin(r0), math.cos(rm), math.sin(rm), math.cos(r1), math.sin(r1))
+        self._child_trig = trig
+        return angles
 
-        for label, start_angle in child_angles.items():
-            end_angle = (start_angle + step) % 360
-            min_a = start_angle
-            max_a = end_angle
-
-            if min_a < max_a:
-                if min_a <= angle < max_a:
-                    return label
-            else:  # wraps around 360
-                if angle >= min_a or angle < max_a:
-                    return label
-        return None
+    def get_outer_sector_from_angle(self, angle, _unused=None):
+        # get_child_angles() is memoised, so a new dict means a new layout
+        child_angles = self.get_child_angles()
+        if child_angles is not self._child_bucket_angles:
+            self._rebuild_child_bucket(child_angles)
+        label = self._child_bucket[int(angle * 2) % 720]
+        if label is _EDGE_BUCKET:
+            labels = self._child_labels
+            k = bisect_right(self._child_bounds, (angle - self._child_first) % 360) - 1
+            label = labels[k] if k < len(labels) else None
+        return label
 
     def _run_script_field(self, info: dict, field: str):
         """Exec the given script field ('command', 'on_release', 'on_double')."""
@@ -2632,71 +3085,56 @@ class RadialMenu(QtWidgets.QWidget):
             return
         try:
             ns = {"cmds": cmds, "__name__": "__radial__"}
-            exec(compile(script, f"<radialMenu:{field}>", "exec"), ns, ns)
+            exec(self._compiled(script, f"<radialMenu:{field}>"), ns, ns)
         except Exception as e:
             print(f"[RadialMenu Error] {field} failed: {e}")
 
-    def _angle_from_pos(self, pt: QtCore.QPoint):
-        c = QtCore.QPoint(self.width() // 2, self.height() // 2)
-        dx = pt.x() - c.x()
-        dy = pt.y() - c.y()
-        return (math.degrees(math.atan2(dy, dx)) + 360) % 360, math.hypot(dx, dy)
-
     def _refresh_hover_from_cursor(self):
         """Re-evaluate hover/selection from the current cursor without requiring mouse movement.
         Clears selection if the cursor is inside the inner hole.
         """
         try:
             # global cursor + widget center in global space
-            gp = QtGui.QCursor.pos()
-            global_center = self.mapToGlobal(QtCore.QPoint(self.width() // 2, self.height() // 2))
-            dx = gp.x() - global_center.x()
-            dy = gp.y() - global_center.y()
-            angle = (math.degrees(math.atan2(dy, dx)) + 360) % 360
-            dist = math.hypot(dx, dy)
-
-            inner_hole = self.inner_hole
-            inner_radius = self.radius
-            outer_inner_radius = self.radius + self.ring_gap
-            outer_outer_radius = self.outer_radius
+            angle, dist2 = self._polar_from_global(QtGui.QCursor.pos())
 
-            # default clear
+            # default clear; the next mouse move must not short-circuit on stale state
+            self._last_hover_state = None
             self.active_sector = None
             self.outer_active_sector = None
             self.hovered_children = None
             self.hovered_child_angles = {}
 
-            # 0) Inside the hole → clear & bail
-            if dist < inner_hole:
-                self.update()
+            # 0) Inside the hole or outside the ring → clear & bail
+            if angle is None or dist2 > self._outer_outer2:
+                self._schedule_update()
                 return
 
             # 1) Inner ring annulus → pick/activate parent + load its children
-            if inner_hole <= dist <= inner_radius:
+            if dist2 <= self._inner_r2:
                 parent = self.get_sector_from_angle(angle)
                 self.active_sector = parent
                 if parent:
-                    kids = self.inner_sections.get(parent, {}).get("children", {})
+                    kids = (self.inner_sections.get(parent) or _EMPTY).get("children") or _EMPTY
                     self.hovered_children = kids
                     self.hovered_child_angles = self.get_child_angles() if kids else {}
-                self.update()
+                self._schedule_update()
                 return
 
             # 2) Outer ring → keep parent context and resolve a child
-            if outer_inner_radius < dist <= outer_outer_radius:
+            if dist2 > self._outer_inner2:
                 parent = self.get_sector_from_angle(angle)
                 self.active_sector = parent
                 if parent:
-                    kids = self.inner_sections.get(parent, {}).get("children", {})
+                    kids = (self.inner_sections.get(parent) or _EMPTY).get("children") or _EMPTY
                     self.hovered_children = kids
                     self.hovered_child_angles = self.get_child_angles() if kids else {}
                     if kids:
                         self.outer_active_sector = self.get_outer_sector_from_angle(angle, self.hovered_child_angles)
-                self.update()
+                self._schedule_update()
                 return
 
             # 3) Elsewhere → clear
-            self.update()
+            self._schedule_update()
 
         except Exception:
             # keep it resilient; hover will recover on the next mouse move
@@ -2722,7 +3160,7 @@ class RadialMenu(QtWidgets.QWidget):
                 return
 
             ns = {"cmds": cmds, "__name__": "__radial__"}
-            exec(compile(script, "<radialMenu:rmb_release>", "exec"), ns, ns)
+            exec(self._compiled(script, "<radialMenu:rmb_release>"), ns, ns)
 
         except Exception as e:
             print(f"[RadialMenu Error] Failed to run script for '{sector}': {e}")
@@ -2732,17 +3170,91 @@ class RadialMenu(QtWidgets.QWidget):
 from PySide6 import QtCore, QtWidgets
 
 from shiboken6 import isValid
+
+# hot-path Qt lookups bound once
+_MBR = QtCore.QEvent.MouseButtonRelease
+_MBP_INT = int(QtCore.QEvent.MouseButtonPress)
+_MBR_INT = int(_MBR)
+_RBTN = QtCore.Qt.RightButton
+_NOBTN = QtCore.Qt.NoButton
+_NOMOD = QtCore.Qt.NoModifier
+_cursor_pos = QtGui.QCursor.pos
+_send = QtCore.QCoreApplication.sendEvent
+
+# the only event types the detector reacts to; everything else is rejected before any other work
+_INTERESTING = frozenset({_MBP_INT, _MBR_INT})
+
+
+class _State:
+    """Radial toggle + installed detector, shared by the install/toggle helpers."""
+    __slots__ = ("enabled", "detector", "script_job")
+
+    def __init__(self):
+        self.enabled = True
+        self.detector = None
+        self.script_job = None
+
+
 class RightClickHoldDetector(QtCore.QObject):
-    def __init__(self, radial_enabled, parent=None):
+    def __init__(self, state, parent=None):
         super().__init__(parent)
         self._radial = None
-        self.radial_enabled = radial_enabled  # store reference
-        self._forwarding_release = False
+        self._state = state  # store reference
+        self._forwarding_release = 0
         self._shutting_down = False  # prevent event processing during shutdown
+        self._targets = set()  # modelPanel widgets (and their children) we are filtering
+        self._focus_hooked = False
+        self._viewport_cache = weakref.WeakKeyDictionary()  # widget -> is under a modelPanel
+
+        # while the popup is up, poll the RMB state at ~60 Hz so the release is forwarded
+        # even if the real release event never reaches a filtered widget
+        self._hold_timer = QtCore.QTimer(self)
+        self._hold_timer.setInterval(16)
+        self._hold_timer.timeout.connect(self._poll_hold)
+        self._swallow_release = False  # the poll already forwarded; eat Maya's real release
+
+    def install(self):
+        """Filter only the modelPanel widgets rather than every event in the QApplication."""
+        self._scan_panels()
+        app = QtWidgets.QApplication.instance()
+        if app is not None and not self._focus_hooked:
+            # panels created later (new layouts, tear-offs) get picked up when they take focus
+            app.focusChanged.connect(self._on_focus_changed)
+            self._focus_hooked = True
+
+    def uninstall(self):
+        app = QtWidgets.QApplication.instance()
+        if app is not None and self._focus_hooked:
+            try:
+                app.focusChanged.disconnect(self._on_focus_changed)
+            except Exception:
+                pass
+            self._focus_hooked = False
+        for w in self._targets:
+            if isValid(w):
+                w.removeEventFilter(self)
+        self._targets.clear()
+
+    def _scan_panels(self):
+        self._targets = {w for w in self._targets if isValid(w)}
+        for panel in cmds.getPanel(type="modelPanel") or []:
+            ptr = omui.MQtUtil.findControl(panel)
+            if not ptr:
+                continue
+            root = wrapInstance(int(ptr), QtWidgets.QWidget)
+            for w in [root] + root.findChildren(QtWidgets.QWidget):
+                if w not in self._targets:
+                    w.installEventFilter(self)
+                    self._targets.add(w)
+
+    def _on_focus_changed(self, old, new):
+        if new is not None and new not in self._targets and self._is_maya_viewport(new):
+            self._scan_panels()
 
     def cleanup(self):
         """Call this before Maya quits to prevent crash."""
         self._shutting_down = True
+        self._hold_timer.stop()
         if self._radial:
             try:
                 self._radial.close()
@@ -2750,15 +3262,21 @@ class RightClickHoldDetector(QtCore.QObject):
             except:
                 pass
 
-    def eventFilter(self, obj, event):
-        # Don't process events during shutdown
-        if self._shutting_down or not self.radial_enabled["state"]:
+    def eventFilter(self, obj, event, _I=_INTERESTING):
+        t = int(event.type())
+        if t not in _I:
             return False
-        if event.type() == QtCore.QEvent.MouseButtonRelease and self._forwarding_release:
+        fwd = self._forwarding_release
+        if fwd and t == _MBR_INT:
+            return False
+        # Don't process events during shutdown
+        if self._shutting_down or not self._state.enabled:
             return False
-        if event.type() == QtCore.QEvent.MouseButtonPress and event.button() == QtCore.Qt.RightButton:
-            if QtWidgets.QApplication.keyboardModifiers() == QtCore.Qt.NoModifier:
-                widget = QtWidgets.QApplication.widgetAt(QtGui.QCursor.pos())
+        if t == _MBP_INT and event.button() == _RBTN:
+            # any new RMB press owns its own release (Alt+RMB dolly etc. must reach Maya)
+            self._swallow_release = False
+            if QtWidgets.QApplication.keyboardModifiers() == _NOMOD:
+                widget = QtWidgets.QApplication.widgetAt(_cursor_pos())
                 if not widget or not self._is_maya_viewport(widget):
                     return False
 
@@ -2781,57 +3299,102 @@ class RightClickHoldDetector(QtCore.QObject):
                 RadialMenuClass = fresh_radial_cls()
 
                 # build a fresh menu
-                self._radial = RadialMenuClass(get_main_window())
-                self._radial.show()
+                self._radial = popup = RadialMenuClass(get_main_window())
+                # the popup grabs the mouse, so the real RMB release goes to it, not the panel
+                popup.installEventFilter(self)
+                popup.destroyed.connect(lambda *_, p=popup: self._drop_radial(p))
+                popup.show()
+                self._hold_timer.start()
                 return True  # block Maya's marking menu
             else:
                 return False
 
-        elif event.type() == QtCore.QEvent.MouseButtonRelease and event.button() == QtCore.Qt.RightButton:
-            w = self._radial
-            if w and isValid(w):
-                local = w.mapFromGlobal(QtGui.QCursor.pos())
-                lp = QtCore.QPointF(local)
-                sp = QtCore.QPointF(QtGui.QCursor.pos())
-                fake_event = QtGui.QMouseEvent(
-                    QtCore.QEvent.MouseButtonRelease,
-                    lp, lp, sp,
-                    QtCore.Qt.RightButton,
-                    QtCore.Qt.NoButton,
-                    QtCore.Qt.NoModifier
-                )
-                # prevent recursion while we synchronously deliver this event
-                self._forwarding_release = True
-                try:
-                    QtCore.QCoreApplication.sendEvent(w, fake_event)
-                finally:
-                    self._forwarding_release = False
-
-                self._radial = None
+        elif t == _MBR_INT and event.button() == _RBTN:
+            if self._forward_release():
                 return True  # we handled the popup case
+            if self._swallow_release:
+                self._swallow_release = False
+                return True
 
             # No popup active -> DO NOT consume; let widgets (like the editor) get their context menus
             return False
         return False
 
+    def _poll_hold(self):
+        if QtWidgets.QApplication.mouseButtons() & _RBTN:
+            return
+        if self._forward_release():
+            self._swallow_release = True
+
+    def _forward_release(self):
+        """Send the RMB release to the open popup. Returns False if there is none."""
+        self._hold_timer.stop()
+        w = self._radial
+        # a popup closed by its own click handling may still be waiting on deleteLater
+        if not w or not isValid(w) or not w.isVisible():
+            return False
+
+        gp = _cursor_pos()
+        # QPoint args are promoted to QPointF by the binding; no need to wrap them here
+        fake_event = QtGui.QMouseEvent(_MBR, w.mapFromGlobal(gp), gp, _RBTN, _NOBTN, _NOMOD)
+        # prevent recursion while we synchronously deliver this event
+        self._forwarding_release = 1
+        try:
+            _send(w, fake_event)
+        finally:
+            self._forwarding_release = 0
+
+        self._radial = None
+        return True
+
+
+    def _drop_radial(self, popup):
+        if self._radial is popup:
+            self._radial = None
+            self._hold_timer.stop()
 
     def _is_maya_viewport(self, widget):
-        while widget:
-            if widget.objectName().startswith("modelPanel"):
-                return True
+        try:
+            return self._viewport_cache[widget]
+        except KeyError:
+            pass
+        key = widget
+        found = False
+        # viewports sit a few levels under their modelPanel; cap the walk for deep transient overlays
+        for _ in range(8):
+            name = widget.objectName()
+            if name and name[:10] == "modelPanel":
+                found = True
+                break
             widget = widget.parent()
-        return False
+            if widget is None:
+                break
+        self._viewport_cache[key] = found
+        return found
 
 
 #################################################################################
+def _sync_detector_filter(state):
+    """Only keep the detector's event filters installed while the radial is enabled."""
+    det = state.detector
+    if det is None:
+        return
+    if state.enabled:
+        det.install()
+    else:
+        det.uninstall()
+
+
 def toggle_radial_menu(force_state=None):
     if force_state is not None:
-        radial_enabled["state"] = bool(force_state)
+        _STATE.enabled = bool(force_state)
     else:
-        radial_enabled["state"] = not radial_enabled["state"]
+        _STATE.enabled = not _STATE.enabled
+    _sync_detector_filter(_STATE)
 
-    state = "ON" if radial_enabled["state"] else "OFF"
-    print(f"Radial Menu is now {state}")
+    state = "ON" if _STATE.enabled else "OFF"
+    if _DEBUG:
+        print(f"Radial Menu is now {state}")
     cmds.inViewMessage(amg=f"Radial Menu: <hl>{state}</hl>", pos='topCenter', fade=True)
 
 
@@ -2839,34 +3402,35 @@ def refresh_radial_menu():
     app = QtWidgets.QApplication.instance()
 
     # Remove existing detector
-    if _rmb_detector_ref["instance"]:
-        app.removeEventFilter(_rmb_detector_ref["instance"])
-        _rmb_detector_ref["instance"] = None
-        print("Old radial menu detector removed.")
+    if _STATE.detector:
+        _STATE.detector.uninstall()
+        _STATE.detector = None
+        if _DEBUG:
+            print("Old radial menu detector removed.")
 
     # Reset toggle state (optional)
-    radial_enabled["state"] = True
+    _STATE.enabled = True
 
     # Recreate and install new detector
-    detector = RightClickHoldDetector(radial_enabled, parent=app)
-    app.installEventFilter(detector)
-    _rmb_detector_ref["instance"] = detector
-    print("Radial menu detector installed fresh.")
+    detector = RightClickHoldDetector(_STATE, parent=app)
+    detector.install()
+    _STATE.detector = detector
+    if _DEBUG:
+        print("Radial menu detector installed fresh.")
 
 
-_rmb_detector_ref = {"instance": None}  # Module-level cache
-radial_enabled = {"state": True}
+_STATE = _State()  # Module-level detector/toggle state
 
 
 def install_rmb_hold_detector():
     app = QtWidgets.QApplication.instance()
-    if _rmb_detector_ref["instance"] is not None:
-        app.removeEventFilter(_rmb_detector_ref["instance"])
+    if _STATE.detector is not None:
+        _STATE.detector.uninstall()
 
     # Create and store new instance
-    detector = RightClickHoldDetector(radial_enabled, parent=app)
-    app.installEventFilter(detector)
-    _rmb_detector_ref["instance"] = detector
+    detector = RightClickHoldDetector(_STATE, parent=app)
+    _STATE.detector = detector
+    _sync_detector_filter(_STATE)  # only installs while the radial is enabled
 
 
 #install_rmb_hold_detector()